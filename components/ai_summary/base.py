@@ -29,18 +29,20 @@ class ImpactContext:
         lines = []
         if "date" not in self.main_data.columns:
             return lines
-        df = self.main_data.copy()
-        df["_year"] = pd.to_datetime(df["date"], errors="coerce").dt.year
-        df = df.dropna(subset=["_year"])
-        df = df[df["_year"] >= 2009]
-        if df.empty:
+        # The loader already parses dates; work on the year Series instead of copying the frame
+        dates = self.main_data["date"]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors="coerce")
+        from_2009 = dates.dt.year >= 2009
+        if not from_2009.any():
             return lines
-        yearly = df.groupby("_year").size().sort_index()
+        years = dates.dt.year[from_2009]
+        yearly = years.value_counts().sort_index()
         lines.append("\n## Publication Trends (from 2009)")
         for year, count in yearly.items():
             lines.append(f"  {int(year)}: {count} papers")
-        if "times_cited" in df.columns:
-            yearly_cit = df.groupby("_year")["times_cited"].sum().sort_index()
+        if "times_cited" in self.main_data.columns:
+            yearly_cit = self.main_data.loc[from_2009, "times_cited"].groupby(years).sum().sort_index()
             lines.append("- Citations per year:")
             for year, cit in yearly_cit.items():
                 lines.append(f"  {int(year)}: {int(cit)} citations")
@@ -201,12 +203,13 @@ class ImpactContext:
         lines.append(f"- Total citations: {total_citations:,}")
 
         if "date" in self.main_data.columns:
-            years = pd.to_datetime(self.main_data["date"], errors="coerce").dt.year.dropna()
+            dates = self.main_data["date"]
+            if not pd.api.types.is_datetime64_any_dtype(dates):
+                dates = pd.to_datetime(dates, errors="coerce")
+            years = dates.dt.year.dropna()
             if not years.empty:
                 lines.append(f"- Publication years range: {int(years.min())}–{int(years.max())}")
-                recent = self.main_data[
-                    pd.to_datetime(self.main_data["date"], errors="coerce").dt.year >= years.max() - 2
-                ]
+                recent = self.main_data[dates.dt.year >= years.max() - 2]
                 lines.append(f"- Publications in last 3 years: {len(recent)}")
 
         if "times_cited" in self.main_data.columns:
@@ -15,6 +15,8 @@ def render_signal_to_action(top20_rows: pd.DataFrame) -> None:
         "in the top 20 trending FOR fields."
     )
 
+    # Build every card first and emit them as one markdown element instead of one per row
+    cards = []
     for _, row in top20_rows.iterrows():
         momentum = row["momentum_pct"]
 
@@ -40,7 +42,7 @@ def render_signal_to_action(top20_rows: pd.DataFrame) -> None:
             label        = "DECLINING"
 
         sign = "+" if momentum >= 0 else ""
-        st.markdown(
+        cards.append(
             f"""
             <div style="border-left:4px solid {border_color}; background:{bg_color};
                         padding:12px 16px; margin-bottom:10px;
@@ -65,6 +67,7 @@ def render_signal_to_action(top20_rows: pd.DataFrame) -> None:
                 Current window: {row["current_count"]:,} grants
               </div>
             </div>
-            """,
-            unsafe_allow_html=True,
+            """
         )
+
+    st.markdown("".join(cards), unsafe_allow_html=True)
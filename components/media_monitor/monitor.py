@@ -74,7 +74,7 @@ class MediaMonitorComponent(BaseComponent):
                 st.error(f"Fetch failed: {e}")
             finally:
                 _progress.empty()
-            st.rerun()
+            # No st.rerun(): the mentions are loaded below in this same run, after the cache clear
 
     def _render_summary(self, df: pd.DataFrame) -> None:
         total = len(df)
@@ -143,6 +143,7 @@ class MediaMonitorComponent(BaseComponent):
             .dropna()
             .value_counts()
             .head(15)
+            .iloc[::-1]
             .reset_index()
         )
         top_sources.columns = ["source", "count"]
@@ -160,7 +161,7 @@ class MediaMonitorComponent(BaseComponent):
             color_discrete_sequence=["#0068c9"],
         )
         fig.update_layout(
-            yaxis={"categoryorder": "total ascending"},
+            yaxis={"type": "category", "categoryorder": "array", "categoryarray": top_sources["source"].tolist()},
             margin=dict(t=10, b=20),
             height=450,
         )
@@ -105,6 +105,11 @@ def _data_table(
     subset = df[available].head(max_rows).copy()
     max_len = 40
     for col in available:
+        if pd.api.types.is_datetime64_any_dtype(subset[col]):
+            subset[col] = subset[col].dt.strftime("%Y-%m-%d")
+        elif isinstance(subset[col].dtype, pd.CategoricalDtype):
+            # A categorical column cannot be filled with a value outside its categories
+            subset[col] = subset[col].astype(object)
         subset[col] = (
             subset[col]
             .fillna("")
@@ -199,9 +204,11 @@ def generate_research_papers_pdf(
 
     if not df_main.empty and "date" in df_main.columns:
         _section_title(pdf, "Recent Publications (last 20)")
-        recent = df_main.sort_values("date", ascending=False).head(20)[
-            ["title", "journal.title", "date", "times_cited"]
-        ].copy()
+        # Partial selection of the 20 newest rows rather than sorting the whole frame
+        recent = df_main.loc[
+            df_main["date"].nlargest(20).index,
+            ["title", "journal.title", "date", "times_cited"],
+        ]
         recent.columns = ["Title", "Journal", "Date", "Citations"]
         _data_table(pdf, recent, list(recent.columns), col_widths=[80, 55, 27, 18])
 
@@ -222,8 +229,14 @@ def generate_research_organisations_pdf(
         pdf.ln()
         return bytes(pdf.output())
 
-    n_orgs = df_affiliations["aff_name"].nunique() if "aff_name" in df_affiliations.columns else 0
-    n_countries = df_affiliations["aff_country"].nunique() if "aff_country" in df_affiliations.columns else 0
+    # One value_counts per column gives both the distinct count and the top-N table
+    # (unused categories dropped so counts match nunique)
+    org_counts, country_counts = (
+        df_affiliations[col].value_counts().loc[lambda c: c > 0] if col in df_affiliations.columns else None
+        for col in ("aff_name", "aff_country")
+    )
+    n_orgs = len(org_counts) if org_counts is not None else 0
+    n_countries = len(country_counts) if country_counts is not None else 0
 
     _section_title(pdf, "Key Metrics")
     _metrics_block(pdf, [
@@ -231,15 +244,15 @@ def generate_research_organisations_pdf(
         ("Affiliated Countries", str(n_countries)),
     ])
 
-    if "aff_name" in df_affiliations.columns:
+    if org_counts is not None:
         _section_title(pdf, "Top Affiliated Organisations")
-        top_orgs = df_affiliations["aff_name"].value_counts().head(30).reset_index()
+        top_orgs = org_counts.head(30).reset_index()
         top_orgs.columns = ["Organisation", "Publication Count"]
         _data_table(pdf, top_orgs, list(top_orgs.columns), col_widths=[145, 35])
 
-    if "aff_country" in df_affiliations.columns:
+    if country_counts is not None:
         _section_title(pdf, "Top Affiliated Countries")
-        top_countries = df_affiliations["aff_country"].value_counts().head(20).reset_index()
+        top_countries = country_counts.head(20).reset_index()
         top_countries.columns = ["Country", "Count"]
         _data_table(pdf, top_countries, list(top_countries.columns), col_widths=[145, 35])
 
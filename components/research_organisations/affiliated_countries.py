@@ -2,24 +2,106 @@
 Affiliated countries component for displaying geographic impact.
 """
 from components.base_component import BaseComponent
-from components.utils import get_country_code, PYCOUNTRY_AVAILABLE
-from typing import Optional
+from components.utils import get_country_codes, top_n_with_other, PYCOUNTRY_AVAILABLE
+from typing import Optional, TYPE_CHECKING
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+# Keyed on the date range, not the data: expires with the cached loader (Refresh Data clears it)
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _country_stats(from_date: Optional[str], to_date: Optional[str], _aff_country: pd.Series) -> pd.Series:
+    """Count publications per affiliated country (empty records dropped), cached per date range."""
+    # Aggregate first (a bincount over the categorical codes), then drop empty/unused
+    # entries from the per-country result instead of masking every row
+    counts = _aff_country.value_counts()
+    return counts[counts > 0].drop('', errors='ignore')
+
+
+@st.cache_resource(show_spinner=False)
+def _build_choropleth(
+    locations: tuple,
+    countries: tuple,
+    counts: tuple,
+    locationmode: str = 'ISO-3',
+) -> "go.Figure":
+    """Build the highlighted-countries world map, reused across reruns for identical inputs."""
+    import plotly.express as px  # deferred: plotly is only needed once this tab renders
+
+    # Binary indicator so every affiliated country is highlighted the same way
+    map_df = pd.DataFrame({
+        'location': locations,
+        'country': countries,
+        'count': counts,
+        'highlight': 1,
+    })
+    fig_map = px.choropleth(
+        map_df,
+        locations='location',
+        locationmode=locationmode,
+        color='highlight',
+        hover_name='country',
+        hover_data={'count': True, 'location': False, 'highlight': False},
+        title="Distribution of Publications by Country",
+        labels={'count': 'Number of Publications'}
+    )
+    # Set all countries to green color (override colorscale)
+    fig_map.update_traces(
+        marker_line_color='white',
+        marker_line_width=0.5,
+        colorscale=[[0, '#2ecc71'], [1, '#2ecc71']],  # Single green color
+        colorbar=None  # Remove colorbar
+    )
+    fig_map.update_layout(
+        height=800,
+        showlegend=False,
+        coloraxis_showscale=False,  # Hide color scale
+        dragmode=False,
+        geo=dict(
+            showframe=False,
+            showcoastlines=True,
+            projection_type='natural earth',
+            bgcolor='rgba(0,0,0,0)'
+        )
+    )
+    return fig_map
+
+
+@st.cache_resource(show_spinner=False)
+def _build_country_pie(countries: tuple, counts: tuple) -> "go.Figure":
+    """Build the pie-chart fallback used when the map cannot be drawn."""
+    import plotly.express as px
+
+    # Top 15 + "Other" keeps the legend and slice count bounded however many countries there are
+    slices = top_n_with_other(pd.Series(counts, index=countries))
+    fig_countries = px.pie(
+        values=slices.to_numpy(),
+        names=slices.index.astype(str),
+        title="Distribution of Publications by Country"
+    )
+    fig_countries.update_layout(height=800)
+    return fig_countries
 
 
 class AffiliatedCountriesComponent(BaseComponent):
     """Component for displaying affiliated countries analysis."""
     
-    def __init__(self, affiliations_data: Optional[pd.DataFrame] = None, **kwargs):
+    def __init__(self, affiliations_data: Optional[pd.DataFrame] = None,
+                 from_date: Optional[str] = None, to_date: Optional[str] = None, **kwargs):
         """
         Initialize the affiliated countries component.
         
         Args:
             affiliations_data: Affiliations DataFrame
+            from_date: Start of the date range the data was loaded for (cache key)
+            to_date: End of the date range the data was loaded for (cache key)
         """
         super().__init__(data=affiliations_data, **kwargs)
+        self.from_date = from_date
+        self.to_date = to_date
     
     def render(self) -> None:
         """Render the affiliated countries component."""
@@ -29,24 +111,18 @@ class AffiliatedCountriesComponent(BaseComponent):
         
         st.markdown('<div class="section-header">🌍 Affiliated Countries We Had Impact On</div>', unsafe_allow_html=True)
         
-        # Get unique countries (drop empty records)
-        affiliated_countries = self.data[self.data['aff_country'].notna() & (self.data['aff_country'] != '')]['aff_country'].unique()
+        # Per-country counts (drop empty records); the index doubles as the unique country list
+        country_counts = _country_stats(self.from_date, self.to_date, self.data['aff_country'])
+        affiliated_countries = country_counts.index
         
         if len(affiliated_countries) > 0:
-            # Create a DataFrame for better display
-            country_df = pd.DataFrame({
-                'Country': affiliated_countries
-            }).sort_values('Country')
-            
-            # Display in columns
+            # Display in columns: one markdown block per column rather than one element per country
+            countries_sorted = sorted(affiliated_countries)
             cols = st.columns(4)
-            for i, country in enumerate(country_df['Country']):
-                with cols[i % 4]:
-                    st.write(f"• {country}")
+            for k, col in enumerate(cols):
+                col.markdown("  \n".join(f"• {country}" for country in countries_sorted[k::4]))
             
             # Create a world map visualization
-            country_counts = self.data[self.data['aff_country'].notna() & (self.data['aff_country'] != '')]['aff_country'].value_counts()
-            
             # Prepare data for choropleth map
             map_df = pd.DataFrame({
                 'country': country_counts.index,
@@ -55,93 +131,33 @@ class AffiliatedCountriesComponent(BaseComponent):
             
             # Convert country names to ISO-3 codes if pycountry is available
             if PYCOUNTRY_AVAILABLE:
-                map_df['iso_code'] = map_df['country'].apply(get_country_code)
+                map_df['iso_code'] = get_country_codes(map_df['country'])
                 map_df = map_df[map_df['iso_code'].notna()]  # Remove countries without ISO codes
                 
                 if len(map_df) > 0:
-                    # Create binary indicator for highlighting countries
-                    map_df['highlight'] = 1
-                    fig_map = px.choropleth(
-                        map_df,
-                        locations='iso_code',
-                        color='highlight',
-                        hover_name='country',
-                        hover_data={'count': True, 'iso_code': False, 'highlight': False},
-                        title="Distribution of Publications by Country",
-                        labels={'count': 'Number of Publications'}
-                    )
-                    # Set all countries to green color (override colorscale)
-                    fig_map.update_traces(
-                        marker_line_color='white',
-                        marker_line_width=0.5,
-                        colorscale=[[0, '#2ecc71'], [1, '#2ecc71']],  # Single green color
-                        colorbar=None  # Remove colorbar
-                    )
-                    fig_map.update_layout(
-                        height=800,
-                        showlegend=False,
-                        coloraxis_showscale=False,  # Hide color scale
-                        dragmode=False,
-                        geo=dict(
-                            showframe=False,
-                            showcoastlines=True,
-                            projection_type='natural earth',
-                            bgcolor='rgba(0,0,0,0)'
-                        )
+                    fig_map = _build_choropleth(
+                        tuple(map_df['iso_code']),
+                        tuple(map_df['country']),
+                        tuple(map_df['count']),
                     )
                     st.plotly_chart(fig_map, width='stretch', config={'scrollZoom': False, 'displayModeBar': False})
                 else:
                     # Fallback to pie chart if no ISO codes found
-                    fig_countries = px.pie(
-                        values=country_counts.values,
-                        names=country_counts.index,
-                        title="Distribution of Publications by Country"
-                    )
-                    fig_countries.update_layout(height=800)
+                    fig_countries = _build_country_pie(tuple(country_counts.index), tuple(country_counts.values))
                     st.plotly_chart(fig_countries, width='stretch')
             else:
                 # Fallback: try using country names directly (plotly may recognize some)
                 try:
-                    # Create binary indicator for highlighting countries
-                    map_df['highlight'] = 1
-                    fig_map = px.choropleth(
-                        map_df,
-                        locations='country',
+                    fig_map = _build_choropleth(
+                        tuple(map_df['country']),
+                        tuple(map_df['country']),
+                        tuple(map_df['count']),
                         locationmode='country names',
-                        color='highlight',
-                        hover_name='country',
-                        hover_data={'count': True, 'highlight': False},
-                        title="Distribution of Publications by Country",
-                        labels={'count': 'Number of Publications'}
-                    )
-                    # Set all countries to green color (override colorscale)
-                    fig_map.update_traces(
-                        marker_line_color='white',
-                        marker_line_width=0.5,
-                        colorscale=[[0, '#2ecc71'], [1, '#2ecc71']],  # Single green color
-                        colorbar=None  # Remove colorbar
-                    )
-                    fig_map.update_layout(
-                        height=800,
-                        showlegend=False,
-                        coloraxis_showscale=False,  # Hide color scale
-                        dragmode=False,
-                        geo=dict(
-                            showframe=False,
-                            showcoastlines=True,
-                            projection_type='natural earth',
-                            bgcolor='rgba(0,0,0,0)'
-                        )
                     )
                     st.plotly_chart(fig_map, width='stretch', config={'scrollZoom': False, 'displayModeBar': False})
                 except Exception:
                     # Final fallback to pie chart
-                    fig_countries = px.pie(
-                        values=country_counts.values,
-                        names=country_counts.index,
-                        title="Distribution of Publications by Country"
-                    )
-                    fig_countries.update_layout(height=800)
+                    fig_countries = _build_country_pie(tuple(country_counts.index), tuple(country_counts.values))
                     st.plotly_chart(fig_countries, width='stretch')
         else:
             st.info("No affiliated countries found.")
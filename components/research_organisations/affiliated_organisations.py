@@ -2,26 +2,139 @@
 Affiliated organisations component for displaying impact analysis.
 """
 from components.base_component import BaseComponent
-from typing import Optional
+from components.utils import top_n_with_other
+from typing import Optional, TYPE_CHECKING
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Complete-organisation table geometry (pixels); height follows the row count up to the cap
+_ROW_HEIGHT = 32
+_MAX_TABLE_HEIGHT = 600
+
+
+# Keyed on the date range, not the data: expires with the cached loader (Refresh Data clears it)
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _org_metrics(from_date: Optional[str], to_date: Optional[str], _affiliations: pd.DataFrame) -> pd.DataFrame:
+    """Unique researchers and citations per organisation/country, cached per date range."""
+    # Single groupby: unique researcher_ids plus citations per unique publication
+    group_keys = ['aff_name', 'aff_country']
+    if 'times_cited' in _affiliations.columns:
+        # Count each publication's citations only once per organisation
+        first_pub_row = ~_affiliations.duplicated(group_keys + ['pub_id'])
+        cited_once = _affiliations['times_cited'].where(first_pub_row, 0)
+    else:
+        cited_once = 0
+    return (
+        _affiliations[group_keys + ['researcher_id']]
+        .assign(times_cited=cited_once)
+        .groupby(group_keys, observed=True, sort=False)
+        .agg(
+            researcher_count=('researcher_id', 'nunique'),
+            times_cited=('times_cited', 'sum'),
+        )
+        .reset_index()
+        # Lower-cased once here so each search is a plain literal substring scan
+        .assign(name_lower=lambda m: m['aff_name'].astype('string[pyarrow]').str.lower())
+    )
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _top_researchers(
+    from_date: Optional[str],
+    to_date: Optional[str],
+    _affiliations: pd.DataFrame,
+    limit: int = 5,
+) -> dict:
+    """Map each organisation to its most-published researchers as a display string."""
+    ids = _affiliations['researcher_id']
+    valid = _affiliations[ids.notna() & (ids != '')]
+    # value_counts orders each organisation's researchers by publication count
+    counts = valid.groupby('aff_name', observed=True)['researcher_id'].value_counts()
+    top = counts.groupby(level=0, observed=True, sort=False).head(limit)
+    names = (
+        valid.drop_duplicates('researcher_id')
+        .set_index('researcher_id')[['first_name', 'last_name']]
+        .reindex(top.index.get_level_values(1))
+        .fillna('')
+    )
+    labels = [
+        f"{first} {last} ({n})"
+        for first, last, n in zip(names['first_name'].tolist(), names['last_name'].tolist(), top.tolist())
+    ]
+    return (
+        pd.Series(labels, index=top.index.get_level_values(0).astype(str))
+        .groupby(level=0, sort=False)
+        .agg(', '.join)
+        .to_dict()
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _build_org_charts(
+    org_names: tuple,
+    researcher_counts: tuple,
+    countries: tuple,
+    country_counts: tuple,
+) -> "go.Figure":
+    """Build the top-organisations bar and organisations-by-country pie as one figure."""
+    import plotly.graph_objects as go  # deferred: plotly is only needed once this tab renders
+    from plotly.subplots import make_subplots
+
+    # One figure (one layout, one Plotly.newPlot) instead of two side-by-side charts
+    fig = make_subplots(
+        rows=1,
+        cols=2,
+        specs=[[{'type': 'bar'}, {'type': 'domain'}]],
+        subplot_titles=("Top 15 Organisations by Researcher Count", "Organisations by Country"),
+    )
+    fig.add_trace(
+        go.Bar(
+            x=list(researcher_counts),
+            y=list(org_names),
+            orientation='h',
+            marker=dict(color=list(researcher_counts), colorscale='Blues'),
+            name='Researchers',
+            showlegend=False,
+            hovertemplate='%{y}<br>Number of Researchers: %{x}<extra></extra>',
+        ),
+        row=1,
+        col=1,
+    )
+    fig.add_trace(
+        go.Pie(values=list(country_counts), labels=list(countries), name='Organisations'),
+        row=1,
+        col=2,
+    )
+    # Bars arrive in ascending order, so the largest is drawn at the top without a client-side sort
+    fig.update_yaxes(type='category', categoryorder='array', categoryarray=list(org_names), row=1, col=1)
+    fig.update_xaxes(title_text='Number of Researchers', row=1, col=1)
+    fig.update_layout(height=500)
+    return fig
 
 
 class AffiliatedOrganisationsComponent(BaseComponent):
     """Component for displaying affiliated organisations analysis."""
     
     def __init__(self, main_data: Optional[pd.DataFrame] = None,
-                 affiliations_data: Optional[pd.DataFrame] = None, **kwargs):
+                 affiliations_data: Optional[pd.DataFrame] = None,
+                 from_date: Optional[str] = None, to_date: Optional[str] = None, **kwargs):
         """
         Initialize the affiliated organisations component.
         
         Args:
             main_data: Main publications DataFrame
             affiliations_data: Affiliations DataFrame
+            from_date: Start of the date range the data was loaded for (cache key)
+            to_date: End of the date range the data was loaded for (cache key)
         """
         super().__init__(data=main_data, **kwargs)
         self.affiliations_data = affiliations_data
+        self.from_date = from_date
+        self.to_date = to_date
     
     def render(self) -> None:
         """Render the affiliated organisations component."""
@@ -31,29 +144,10 @@ class AffiliatedOrganisationsComponent(BaseComponent):
         
         st.markdown('<div class="section-header">🏢 Affiliated Organisations We Had Impact On</div>', unsafe_allow_html=True)
         
-        # Calculate metrics per organisation, grouped by aff_name and aff_country
-        # Count unique researcher_id values for each organisation
-        # Group by both aff_name and aff_country, then count unique researcher_ids
-        org_metrics = self.affiliations_data.groupby(['aff_name', 'aff_country']).agg({
-            'researcher_id': 'nunique'  # Count unique researcher IDs
-        }).reset_index()
-        org_metrics.columns = ['aff_name', 'aff_country', 'researcher_count']
-
-        
-        # Add citation data if available
-        if 'times_cited' in self.affiliations_data.columns:
-            # First, ensure pub_id is unique per organisation before counting citations
-            # Group by aff_name, aff_country, and pub_id to get unique publications per org
-            unique_pubs = self.affiliations_data.groupby(['aff_name', 'aff_country', 'pub_id'])['times_cited'].first().reset_index()
-            # Now sum citations per organisation
-            org_citations = unique_pubs.groupby(['aff_name', 'aff_country'])['times_cited'].sum().reset_index()
-            org_metrics = org_metrics.merge(org_citations, on=['aff_name', 'aff_country'], how='left')
-            org_metrics['times_cited'] = org_metrics['times_cited'].fillna(0)
-        else:
-            org_metrics['times_cited'] = 0
-        
-        # Sort by publication count (descending)
-        org_metrics = org_metrics.sort_values('researcher_count', ascending=False)
+        # Per-organisation metrics, cached on just the columns they depend on
+        metric_cols = [c for c in ('aff_name', 'aff_country', 'researcher_id', 'pub_id', 'times_cited')
+                       if c in self.affiliations_data.columns]
+        org_metrics = _org_metrics(self.from_date, self.to_date, self.affiliations_data[metric_cols])
         
         # Summary metrics
         col1, col2, col3 = st.columns([1,1,2])
@@ -62,9 +156,14 @@ class AffiliatedOrganisationsComponent(BaseComponent):
         with col2:
             st.metric("Avg Publications/Org", f"{org_metrics['researcher_count'].mean():.1f}")
         with col3:
-            top_org_name = org_metrics.iloc[0]['aff_name']
+            top_org_name = org_metrics.nlargest(1, 'researcher_count')['aff_name'].iloc[0]
             st.metric("Top Contributing Org", top_org_name)
         
+        self._render_explorer(org_metrics)
+    
+    @st.fragment
+    def _render_explorer(self, org_metrics: pd.DataFrame) -> None:
+        """Search, sort, tables and charts; widget changes rerun only this fragment."""
         # Search and filter options
         st.subheader("🔍 Organisation Explorer")
         
@@ -74,14 +173,15 @@ class AffiliatedOrganisationsComponent(BaseComponent):
         with col2:
             sort_by = st.selectbox("Sort by:", ["Publications", "Citations", "Name", "Country"])
         
-        # Filter organisations based on search
+        # Filter organisations based on search: a literal substring match on the cached lower-cased names
         if search_term:
-            filtered_orgs = org_metrics[org_metrics['aff_name'].str.contains(search_term, case=False, na=False)]
+            name_match = org_metrics['name_lower'].str.contains(search_term.lower(), regex=False, na=False)
+            filtered_orgs = org_metrics[name_match]
         else:
             filtered_orgs = org_metrics.copy()
         
         # Sort based on selection
-        if sort_by == "Researchers":
+        if sort_by == "Publications":
             filtered_orgs = filtered_orgs.sort_values('researcher_count', ascending=False)
         elif sort_by == "Citations":
             filtered_orgs = filtered_orgs.sort_values('times_cited', ascending=False)
@@ -94,99 +194,60 @@ class AffiliatedOrganisationsComponent(BaseComponent):
         if not filtered_orgs.empty:
             st.info(f"Showing {len(filtered_orgs)} organisations (filtered from {len(org_metrics)} total)")
             
-            # Create expandable sections for top organisations
+            # One table for the top organisations instead of an expander (and its widgets) per row
             st.subheader("🏆 Top Contributing Organisations")
+            top_orgs = filtered_orgs.head(20)
+            top_table = pd.DataFrame({
+                'Organisation': top_orgs['aff_name'].to_numpy(),
+                'Country': top_orgs['aff_country'].to_numpy(),
+                'Unique Researchers': top_orgs['researcher_count'].to_numpy(),
+                'Total Citations': top_orgs['times_cited'].to_numpy(),
+            }, index=pd.RangeIndex(1, len(top_orgs) + 1, name='#'))
+            researcher_cols = ['aff_name', 'researcher_id', 'first_name', 'last_name']
+            if all(c in self.affiliations_data.columns for c in researcher_cols):
+                top_researchers = _top_researchers(self.from_date, self.to_date, self.affiliations_data[researcher_cols])
+                top_table['Top Researchers'] = [top_researchers.get(name, '') for name in top_orgs['aff_name'].tolist()]
             
-            # Show top 20 in expandable format
-            for i, (_, org) in enumerate(filtered_orgs.head(20).iterrows()):
-                with st.expander(f"#{i+1} {org['aff_name']} ({org['researcher_count']} unique researchers)"):
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Unique Researchers", org['researcher_count'])
-                    with col2:
-                        st.metric("Total Citations", f"{org['times_cited']:,}")
-                    with col3:
-                        st.metric("Country", org['aff_country'])
-                    
-                    # Show publications from this organisation
-                    org_researcher = self.affiliations_data[self.affiliations_data['aff_name'] == org['aff_name']]
-                    if not org_researcher.empty:
-                        st.write("**Researchers from this organisation:**")
-                        st.write(f"• {org['researcher_count']} unique researchers found")
-                        # If we have researcher IDs, we could link to main research groups
-                        if 'researcher_id' in self.affiliations_data.columns:
-                            org_researcher_filtered = org_researcher[org_researcher['researcher_id'].notna() & (org_researcher['researcher_id'] != '')]
-                            all_researcher_counts = org_researcher_filtered['researcher_id'].value_counts()
-                            top5_researcher_counts = all_researcher_counts.head(5)
-                            researcher_ids = top5_researcher_counts.index.tolist()
-                            if len(researcher_ids) > 0:
-                                has_names = 'first_name' in self.affiliations_data.columns and 'last_name' in self.affiliations_data.columns
-                                if has_names:
-                                    st.write("**Top researchers from this organisation:**")
-                                    for idx, researcher_id in enumerate(researcher_ids, 1):
-                                        researcher_affiliation = self.affiliations_data[
-                                            self.affiliations_data['researcher_id'] == researcher_id
-                                        ]
-                                        if not researcher_affiliation.empty:
-                                            first_name = researcher_affiliation['first_name'].iloc[0]
-                                            last_name = researcher_affiliation['last_name'].iloc[0]
-                                            pub_count = top5_researcher_counts[researcher_id]
-                                            st.markdown(f"**{idx}.** {first_name} {last_name} ({pub_count} publication{'s' if pub_count > 1 else ''})")
-
-                                    if len(all_researcher_counts) > 5:
-                                        with st.expander(f"See all {len(all_researcher_counts)} researchers"):
-                                            for idx, (researcher_id, pub_count) in enumerate(all_researcher_counts.items(), 1):
-                                                researcher_affiliation = self.affiliations_data[
-                                                    self.affiliations_data['researcher_id'] == researcher_id
-                                                ]
-                                                if not researcher_affiliation.empty:
-                                                    first_name = researcher_affiliation['first_name'].iloc[0]
-                                                    last_name = researcher_affiliation['last_name'].iloc[0]
-                                                    st.markdown(f"**{idx}.** {first_name} {last_name} ({pub_count} publication{'s' if pub_count > 1 else ''})")
-                        else:
-                            st.write("• Researcher details available in main dataset")
+            st.dataframe(
+                top_table,
+                width='stretch',
+                column_config={'Total Citations': st.column_config.NumberColumn(format='%d')},
+            )
             
             # Interactive data table
             st.subheader("📊 Complete Organisation Data")
-            display_orgs = filtered_orgs[['aff_name', 'aff_country', 'researcher_count', 'times_cited']].copy()
-            display_orgs.columns = ['Organisation', 'Country', 'Publications', 'Total Citations']
-            display_orgs['Avg Citations'] = (display_orgs['Total Citations'] / display_orgs['Publications']).round(1)
+            researcher_counts = filtered_orgs['researcher_count'].to_numpy()
+            total_citations = filtered_orgs['times_cited'].to_numpy()
+            display_orgs = pd.DataFrame({
+                'Organisation': filtered_orgs['aff_name'].to_numpy(),
+                'Country': filtered_orgs['aff_country'].to_numpy(),
+                'Publications': researcher_counts,
+                'Total Citations': total_citations,
+                'Avg Citations': np.round(total_citations / np.where(researcher_counts == 0, 1, researcher_counts), 1),
+            })
             
+            # Mount the grid with its final height and a fixed row height so the virtualised
+            # table neither auto-sizes nor measures rows on each rerun
             st.dataframe(
                 display_orgs,
                 width='stretch',
+                height=min((len(display_orgs) + 1) * _ROW_HEIGHT + 3, _MAX_TABLE_HEIGHT),
+                row_height=_ROW_HEIGHT,
                 hide_index=True
             )
             
-            # Visualizations
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Top 15 organisations by publications
-                top_15 = filtered_orgs.head(15)
-                fig_orgs = px.bar(
-                    top_15,
-                    x='researcher_count',
-                    y='aff_name',
-                    orientation='h',
-                    title="Top 15 Organisations by Researcher Count",
-                    labels={'researcher_count': 'Number of Researchers', 'aff_name': 'Organisation'},
-                    color='researcher_count',
-                    color_continuous_scale='Blues'
-                )
-                fig_orgs.update_layout(height=500, yaxis={'categoryorder': 'total ascending'})
-                st.plotly_chart(fig_orgs, width='stretch')
-            
-            with col2:
-                # Organisations by country
-                country_org_counts = filtered_orgs.groupby('aff_country').size().sort_values(ascending=False)
-                fig_countries = px.pie(
-                    values=country_org_counts.values,
-                    names=country_org_counts.index,
-                    title="Organisations by Country"
-                )
-                fig_countries.update_layout(height=500)
-                st.plotly_chart(fig_countries, width='stretch')
+            # Visualizations: top 15 organisations by researcher count, and organisations by country
+            # Plain strings so the axis only carries these 15 organisations, not every category;
+            # ascending order so the largest bar is drawn at the top
+            top_15 = filtered_orgs.nlargest(15, 'researcher_count').iloc[::-1]
+            country_org_counts = top_n_with_other(filtered_orgs.groupby('aff_country', observed=True).size())
+            fig_orgs = _build_org_charts(
+                tuple(top_15['aff_name'].astype(str)),
+                tuple(top_15['researcher_count'].tolist()),
+                tuple(country_org_counts.index.astype(str)),
+                tuple(country_org_counts.tolist()),
+            )
+            st.plotly_chart(fig_orgs, width='stretch')
         else:
             st.warning("No organisations found matching your search criteria.")
 
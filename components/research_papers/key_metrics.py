@@ -7,20 +7,50 @@ import streamlit as st
 import pandas as pd
 
 
+# Keyed on the date range, not the data: expires with the cached loader (Refresh Data clears it)
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _key_metrics(
+    from_date: Optional[str],
+    to_date: Optional[str],
+    _times_cited: pd.Series,
+    _aff_names: Optional[pd.Series] = None,
+    _aff_countries: Optional[pd.Series] = None,
+) -> tuple:
+    """Return (publications, citations, organisations, countries), cached across reruns.
+
+    Keyed on the sidebar date range that selected the frames; the underscore-prefixed
+    Series are not hashed by Streamlit.
+    """
+    total_citations = _times_cited.sum()
+    if _aff_names is None:
+        return len(_times_cited), total_citations, 0, 0
+    return (
+        len(_times_cited),
+        total_citations,
+        _aff_names.nunique(dropna=False),
+        _aff_countries.nunique(dropna=False),
+    )
+
+
 class KeyMetricsComponent(BaseComponent):
     """Component for displaying key metrics."""
     
     def __init__(self, main_data: Optional[pd.DataFrame] = None, 
-                 affiliations_data: Optional[pd.DataFrame] = None, **kwargs):
+                 affiliations_data: Optional[pd.DataFrame] = None,
+                 from_date: Optional[str] = None, to_date: Optional[str] = None, **kwargs):
         """
         Initialize the key metrics component.
         
         Args:
             main_data: Main publications DataFrame
             affiliations_data: Affiliations DataFrame
+            from_date: Start of the date range the data was loaded for (cache key)
+            to_date: End of the date range the data was loaded for (cache key)
         """
         super().__init__(data=main_data, **kwargs)
         self.affiliations_data = affiliations_data
+        self.from_date = from_date
+        self.to_date = to_date
     
     def render(self) -> None:
         """Render the key metrics component."""
@@ -31,15 +61,19 @@ class KeyMetricsComponent(BaseComponent):
         st.markdown('<div class="section-header">📈 Key Metrics (All Time)</div>', unsafe_allow_html=True)
         
         # Calculate metrics
-        total_publications = len(self.data)
-        total_citations = self.data['times_cited'].sum()
-        
-        affiliated_organisations_count = 0
-        affiliated_countries_count = 0
-        
-        if self.affiliations_data is not None and not self.affiliations_data.empty:
-            affiliated_organisations_count = len(self.affiliations_data['aff_name'].unique())
-            affiliated_countries_count = len(self.affiliations_data['aff_country'].unique())
+        has_affiliations = self.affiliations_data is not None and not self.affiliations_data.empty
+        (
+            total_publications,
+            total_citations,
+            affiliated_organisations_count,
+            affiliated_countries_count,
+        ) = _key_metrics(
+            self.from_date,
+            self.to_date,
+            self.data['times_cited'],
+            self.affiliations_data['aff_name'] if has_affiliations else None,
+            self.affiliations_data['aff_country'] if has_affiliations else None,
+        )
         
         # Display metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -2,10 +2,18 @@
 Recent papers component for displaying most recent publications.
 """
 from components.base_component import BaseComponent
-from components.utils import get_first_author_name
 import streamlit as st
 import pandas as pd
 
+# Source column -> table heading, applied in one rename
+_DISPLAY_COLUMNS = {
+    'title': 'Title',
+    'first_author_name': 'First Author',
+    'date': 'Publication Date',
+    'journal.title': 'Journal',
+    'times_cited': 'Citations',
+}
+
 
 class RecentPapersComponent(BaseComponent):
     """Component for displaying most recent papers."""
@@ -29,37 +37,30 @@ class RecentPapersComponent(BaseComponent):
         
         st.markdown('<div class="section-header">📚 Top 5 Most Recent Papers Citing AURIN</div>', unsafe_allow_html=True)
         
-        # Work with a copy to avoid mutating original data
-        data_copy = self.data.copy()
-        
-        # Convert date column to datetime if not already
-        if 'date' in data_copy.columns:
-            data_copy['date'] = pd.to_datetime(data_copy['date'], errors='coerce')
+        # Convert date column to datetime if not already (without copying the frame)
+        dates = self.data['date']
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors='coerce')
         
-        # Calculate top most recent papers
-        top_recent_papers = data_copy.sort_values(by='date', ascending=False).head(self.top_n)
+        # Calculate top most recent papers: select the rows first, then materialise only those
+        if pd.Index(dates.to_numpy().view('i8')).is_monotonic_decreasing:
+            # Already newest-first from the loader (NaT sorts last as int64 min): take the head
+            head = dates.iloc[:self.top_n]
+            idx = head.index[head.notna()]
+        else:
+            idx = dates.nlargest(self.top_n).index
+        top_recent_papers = self.data.loc[idx].assign(date=dates.loc[idx])
         
         if not top_recent_papers.empty:
-            # Create base display dataframe
-            recent_display_df = top_recent_papers[['title', 'date', 'journal.title', 'times_cited']].copy()
-            
-            # Extract first author's name from authors column if available
-            if 'authors' in top_recent_papers.columns:
-                # Apply function to extract author names
-                author_names = top_recent_papers['authors'].apply(get_first_author_name)
-                recent_display_df['first_author_name'] = author_names.apply(lambda x: x[0]+" "+x[1] if x[0] and x[1] else '')
-                # Reorder columns: Title, First Author Name, Publication Date, Journal, Citations
-                recent_display_df = recent_display_df[['title', 'first_author_name', 'date', 'journal.title', 'times_cited']]
-                recent_display_df.columns = ['Title', 'First Author', 'Publication Date', 'Journal', 'Citations']
-            else:
-                recent_display_df.columns = ['Title', 'Publication Date', 'Journal', 'Citations']
-            
-            recent_display_df['Publication Date'] = pd.to_datetime(recent_display_df['Publication Date']).dt.strftime('%Y-%m-%d')
+            # Title, First Author (derived once in the cached loader), Publication Date, Journal, Citations
+            cols = [c for c in _DISPLAY_COLUMNS if c in top_recent_papers.columns]
+            recent_display_df = top_recent_papers[cols].rename(columns=_DISPLAY_COLUMNS)
             
             st.dataframe(
                 recent_display_df,
                 width='stretch',
-                hide_index=True
+                hide_index=True,
+                column_config={'Publication Date': st.column_config.DateColumn(format='YYYY-MM-DD')},
             )
         else:
             st.info("No recent papers found.")
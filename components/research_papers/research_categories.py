@@ -68,8 +68,10 @@ class ResearchCategoriesComponent(BaseComponent):
                 st.metric(label=row['Category'], value=f"{row['Papers']} papers")
 
         with st.expander(f"View all {len(counts)} categories"):
+            # Already sorted by value_counts: reverse so the largest bar sits at the top
+            chart_counts = counts.iloc[::-1]
             fig = px.bar(
-                counts,
+                chart_counts,
                 x='Papers',
                 y='Category',
                 orientation='h',
@@ -80,7 +82,7 @@ class ResearchCategoriesComponent(BaseComponent):
             )
             fig.update_layout(
                 height=max(400, len(counts) * 28),
-                yaxis={'categoryorder': 'total ascending'},
+                yaxis={'type': 'category', 'categoryorder': 'array', 'categoryarray': chart_counts['Category'].tolist()},
                 coloraxis_showscale=False,
                 margin=dict(l=10, r=10, t=40, b=10),
             )
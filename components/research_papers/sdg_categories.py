@@ -184,7 +184,7 @@ class SDGCategoriesComponent(BaseComponent):
             chart_df = pd.DataFrame([
                 {'SDG': f"SDG {n}: {SDG_META[n][0].replace(chr(10), ' ')}", 'Papers': c}
                 for n, c in sorted(active.items())
-            ])
+            ]).sort_values('Papers', kind='stable')
             with st.expander(f"View breakdown ({len(active)} SDGs)"):
                 fig = px.bar(
                     chart_df,
@@ -196,7 +196,7 @@ class SDGCategoriesComponent(BaseComponent):
                 )
                 fig.update_layout(
                     height=max(300, len(active) * 32),
-                    yaxis={'categoryorder': 'total ascending'},
+                    yaxis={'type': 'category', 'categoryorder': 'array', 'categoryarray': chart_df['SDG'].tolist()},
                     coloraxis_showscale=False,
                     margin=dict(l=10, r=10, t=10, b=10),
                 )
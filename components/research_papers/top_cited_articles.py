@@ -5,6 +5,14 @@ from components.base_component import BaseComponent
 import streamlit as st
 import pandas as pd
 
+# Source column -> table heading, applied in one rename
+_DISPLAY_COLUMNS = {
+    'title': 'Title',
+    'times_cited': 'Citations',
+    'journal.title': 'Journal',
+    'date': 'Publication Date',
+}
+
 
 class TopCitedArticlesComponent(BaseComponent):
     """Component for displaying top cited articles."""
@@ -28,28 +36,28 @@ class TopCitedArticlesComponent(BaseComponent):
         
         st.markdown(f'<div class="section-header">🏆 Top {self.top_n} Most Cited Articles</div>', unsafe_allow_html=True)
         
-        # Calculate top cited articles
-        top_cited_articles = self.data.nlargest(self.top_n, 'times_cited')
+        # Project the displayed columns first so nlargest/sort only carry what is shown
+        cited = self.data[list(_DISPLAY_COLUMNS)].rename(columns=_DISPLAY_COLUMNS)
+        # The loader already parses dates; only fall back to parsing for raw string input
+        if not pd.api.types.is_datetime64_any_dtype(cited['Publication Date']):
+            cited['Publication Date'] = pd.to_datetime(cited['Publication Date'], errors='coerce')
+        
+        # Calculate top cited articles: nlargest is a partial selection that keeps the first occurrence on ties
+        top_cited_articles = cited.nlargest(self.top_n, 'Citations')
         
         if not top_cited_articles.empty:
-            # Create a more detailed table
-            display_df = top_cited_articles[['title', 'times_cited', 'journal.title', 'date']].copy()
-            display_df.columns = ['Title', 'Citations', 'Journal', 'Publication Date']
-            display_df['Publication Date'] = pd.to_datetime(display_df['Publication Date']).dt.strftime('%Y-%m-%d')
-
+            # Create a more detailed table; dates are formatted client-side (no string copy per render)
             st.dataframe(
-                display_df,
+                top_cited_articles,
                 width='stretch',
-                hide_index=True
+                hide_index=True,
+                column_config={'Publication Date': st.column_config.DateColumn(format='YYYY-MM-DD')},
             )
 
             # Prepare full sorted list for download
-            all_cited = self.data.sort_values('times_cited', ascending=False)
+            all_cited = cited.sort_values('Citations', ascending=False)
             if not all_cited.empty:
-                download_df = all_cited[['title', 'times_cited', 'journal.title', 'date']].copy()
-                download_df.columns = ['Title', 'Citations', 'Journal', 'Publication Date']
-                download_df['Publication Date'] = pd.to_datetime(download_df['Publication Date']).dt.strftime('%Y-%m-%d')
-                csv = download_df.to_csv(index=False)
+                csv = all_cited.to_csv(index=False, date_format='%Y-%m-%d')
                 st.download_button(
                     label="⬇️ Download all articles as CSV",
                     data=csv,
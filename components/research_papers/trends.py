@@ -15,12 +15,12 @@ class TrendsComponent(BaseComponent):
         super().__init__(data=data, **kwargs)
 
     def _prepare_yearly_data(self) -> pd.DataFrame:
-        df = self.data.copy()
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
-        df = df.dropna(subset=['date'])
-        df['year'] = df['date'].dt.year
-        df = df[df['year'] >= 2009] # Filter for publications from 2009 onwards when AURIN started contributing.
-        return df
+        # Filter on the parsed dates first so only matching rows are materialised (no full-frame copy)
+        dates = self.data['date']
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors='coerce')
+        mask = dates.dt.year >= 2009 # Filter for publications from 2009 onwards when AURIN started contributing.
+        return self.data.loc[mask].assign(date=dates[mask], year=dates[mask].dt.year)
 
     def _render_papers_per_year(self, df: pd.DataFrame) -> None:
         yearly_counts = df.groupby('year').size().reset_index(name='papers')
@@ -68,7 +68,7 @@ class TrendsComponent(BaseComponent):
             return
 
         type_year = (
-            df.groupby(['year', 'type'])
+            df.groupby(['year', 'type'], observed=True)
             .size()
             .reset_index(name='count')
             .sort_values('year')
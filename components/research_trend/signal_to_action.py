@@ -15,6 +15,8 @@ def render_signal_to_action(top20_rows: pd.DataFrame) -> None:
         "in the top 20 trending Core FOR fields."
     )
 
+    # Build every card first and emit them as one markdown element instead of one per row
+    cards = []
     for _, row in top20_rows.iterrows():
         momentum = row["momentum_pct"]
 
@@ -35,7 +37,7 @@ def render_signal_to_action(top20_rows: pd.DataFrame) -> None:
             label        = "STEADY"
 
         sign = "+" if momentum >= 0 else ""
-        st.markdown(
+        cards.append(
             f"""
             <div style="border-left:4px solid {border_color}; background:{bg_color};
                         padding:12px 16px; margin-bottom:10px;
@@ -60,6 +62,7 @@ def render_signal_to_action(top20_rows: pd.DataFrame) -> None:
                 Current window: {row["current_count"]:,} publications
               </div>
             </div>
-            """,
-            unsafe_allow_html=True,
+            """
         )
+
+    st.markdown("".join(cards), unsafe_allow_html=True)
@@ -3,8 +3,11 @@ Sidebar component: hierarchical navigation + modal config dialog.
 """
 from components.base_component import BaseComponent
 from components._constants import _ENV_DIMENSIONS, _ENV_OPENROUTER
+import requests
 import streamlit as st
 
+_AURIN_LOGO_URL = "https://data.aurin.org.au/assets/aurin-logo-400-D0zkc36m.png"
+
 IMPACT_METRICS_TABS = [
     ("🤖 Executive Summary", "ai_summary"),
     ("📄 Research Papers", "research_papers"),
@@ -22,6 +25,22 @@ IMPACT_SPACE_TABS = [
 ]
 
 
+@st.cache_resource(show_spinner=False, ttl=24 * 60 * 60)
+def _aurin_logo() -> bytes | str:
+    """Fetch the AURIN logo once per process so reruns don't re-request it."""
+    try:
+        response = requests.get(_AURIN_LOGO_URL, timeout=5)
+        response.raise_for_status()
+    except requests.RequestException:
+        # Cache the fallback too: an offline server must not stall every rerun on the timeout
+        return _AURIN_LOGO_URL  # let the browser fetch it
+    return response.content
+
+
+def _set_active_tab(key: str) -> None:
+    st.session_state.active_tab = key
+
+
 @st.dialog("⚙️ Configure Dashboard")
 def _show_config_dialog():
     """Modal dialog for entering API credentials and date range."""
@@ -93,6 +112,21 @@ def _show_config_dialog():
             st.rerun()
 
 
+@st.fragment
+def _config_panel():
+    """Configure button and key status; clicking it reruns only this fragment, not the tabs."""
+    if st.button("⚙️ Configure", width='stretch'):
+        st.session_state.show_config = True
+
+    if st.session_state.get('show_config'):
+        _show_config_dialog()
+
+    if st.session_state.get('api_key'):
+        st.success("✅ Dimensions API key active")
+    if st.session_state.get('openrouter_api_key'):
+        st.success("✅ OpenRouter API key active")
+
+
 class SidebarComponent(BaseComponent):
     """Sidebar with hierarchical navigation and modal configuration."""
 
@@ -119,15 +153,16 @@ class SidebarComponent(BaseComponent):
     def _nav_button(self, label: str, key: str) -> None:
         is_active = st.session_state.get('active_tab') == key
         btn_label = f"▸ {label}" if is_active else f"   {label}"
-        if st.sidebar.button(btn_label, key=f"nav_{key}"):
-            st.session_state.active_tab = key
-            st.rerun()
+        # Callback runs before the script, so the click lands in a single run (no forced rerun)
+        st.sidebar.button(
+            btn_label,
+            key=f"nav_{key}",
+            on_click=_set_active_tab,
+            args=(key,),
+        )
 
     def render(self) -> None:
-        st.sidebar.image(
-            "https://data.aurin.org.au/assets/aurin-logo-400-D0zkc36m.png",
-            width='stretch'
-        )
+        st.sidebar.image(_aurin_logo(), width='stretch')
 
         st.sidebar.markdown(
             '<p class="nav-group-label">📊 Impact Metrics</p>',
@@ -147,16 +182,8 @@ class SidebarComponent(BaseComponent):
 
         st.sidebar.markdown("---")
 
-        if st.sidebar.button("⚙️ Configure", width='stretch'):
-            st.session_state.show_config = True
-
-        if st.session_state.get('show_config'):
-            _show_config_dialog()
-
-        if st.session_state.get('api_key'):
-            st.sidebar.success("✅ Dimensions API key active")
-        if st.session_state.get('openrouter_api_key'):
-            st.sidebar.success("✅ OpenRouter API key active")
+        with st.sidebar:
+            _config_panel()
 
     def get_active_tab(self) -> str:
         return st.session_state.get('active_tab', 'research_papers')
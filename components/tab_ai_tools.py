@@ -239,14 +239,16 @@ def build_research_papers_context(
     # Year range + yearly papers & citations (mirrors TrendsComponent)
     date_col = "date" if "date" in df_main.columns else ("year" if "year" in df_main.columns else None)
     if date_col:
-        df_yr = df_main.copy()
         if date_col == "date":
-            df_yr["_year"] = pd.to_datetime(df_yr["date"], errors="coerce").dt.year
+            dates = df_main["date"]
+            if not pd.api.types.is_datetime64_any_dtype(dates):
+                dates = pd.to_datetime(dates, errors="coerce")
+            years = dates.dt.year
         else:
-            df_yr["_year"] = pd.to_numeric(df_yr["year"], errors="coerce")
-        df_yr = df_yr.dropna(subset=["_year"])
-        df_yr["_year"] = df_yr["_year"].astype(int)
-        df_yr = df_yr[df_yr["_year"] >= 2009]
+            years = pd.to_numeric(df_main["year"], errors="coerce")
+        # Only the year (and citations) are needed, so slice those rather than copying the frame
+        from_2009 = years >= 2009
+        df_yr = df_main.loc[from_2009, [cit_col] if cit_col else []].assign(_year=years[from_2009].astype(int))
 
         if not df_yr.empty:
             lines.append(f"YEAR RANGE: {df_yr['_year'].min()} – {df_yr['_year'].max()}")
@@ -262,29 +264,33 @@ def build_research_papers_context(
 
     # Top cited papers (mirrors TopCitedArticlesComponent)
     if cit_col and "title" in df_main.columns:
-        top_cited = df_main.nlargest(10, cit_col)[["title", cit_col, "date"]].copy() \
-            if "date" in df_main.columns else df_main.nlargest(10, cit_col)[["title", cit_col]].copy()
+        top_cited = df_main.nlargest(10, cit_col)
+        # Years for the selected rows in one vectorised pass rather than a per-row re-parse
+        if "date" in top_cited.columns:
+            cited_dates = top_cited["date"]
+            if not pd.api.types.is_datetime64_any_dtype(cited_dates):
+                cited_dates = pd.to_datetime(cited_dates, errors="coerce")
+            years = cited_dates.dt.year
+        else:
+            years = pd.Series(pd.NA, index=top_cited.index)
         lines.append("\nTOP CITED PAPERS:")
-        for _, row in top_cited.iterrows():
-            yr = ""
-            if "date" in row.index and pd.notna(row.get("date")):
-                try:
-                    yr = f" ({pd.to_datetime(row['date']).year})"
-                except Exception:
-                    pass
+        for (_, row), year in zip(top_cited.iterrows(), years):
+            yr = f" ({int(year)})" if pd.notna(year) else ""
             title = str(row["title"])[:100]
             lines.append(f"  \"{title}\"{yr} — {int(row[cit_col])} citations")
 
     # Recent papers (mirrors RecentPapersComponent)
     if "title" in df_main.columns and "date" in df_main.columns:
-        df_recent = df_main.copy()
-        df_recent["_date"] = pd.to_datetime(df_recent["date"], errors="coerce")
-        recent = df_recent.dropna(subset=["_date"]).nlargest(5, "_date")
+        dates = df_main["date"]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors="coerce")
+        recent_idx = dates.nlargest(5).index
+        recent = df_main.loc[recent_idx].assign(_date=dates.loc[recent_idx].dt.strftime("%Y-%m-%d"))
         lines.append("\nMOST RECENT PAPERS:")
         for _, row in recent.iterrows():
             journal = f" — {row['journal.title']}" if "journal.title" in row.index and pd.notna(row.get("journal.title")) else ""
             cit = f" | {int(row[cit_col])} citations" if cit_col else ""
-            lines.append(f"  \"{str(row['title'])[:80]}\" ({row['_date'].strftime('%Y-%m-%d')}){journal}{cit}")
+            lines.append(f"  \"{str(row['title'])[:80]}\" ({row['_date']}){journal}{cit}")
 
     # Fields of Research (mirrors ResearchCategoriesComponent)
     if "category_for" in df_main.columns:
@@ -374,18 +380,18 @@ def build_research_organisations_context(
     # group by org + country, count unique researchers, sum citations
     if has_name and has_country:
         grp_cols = ["aff_name", "aff_country"]
-        agg = {"researcher_id": "nunique"} if has_researcher else {}
-        if agg:
-            org_metrics = df_affiliations.groupby(grp_cols).agg(agg).reset_index()
-            org_metrics.columns = ["aff_name", "aff_country", "researcher_count"]
-        else:
-            org_metrics = df_affiliations.groupby(grp_cols).size().reset_index(name="researcher_count")
-
+        # One pass: unique researchers plus each publication's citations counted once per org
+        # (without researcher ids, every affiliation row counts)
+        agg = {"researcher_count": ("researcher_id", "nunique" if has_researcher else "size")}
+        org_frame = df_affiliations[grp_cols].assign(
+            researcher_id=df_affiliations["researcher_id"] if has_researcher else 0
+        )
         if has_cited and has_pub:
-            unique_pubs = df_affiliations.groupby(grp_cols + ["pub_id"])["times_cited"].first().reset_index()
-            org_cit = unique_pubs.groupby(grp_cols)["times_cited"].sum().reset_index()
-            org_cit.columns = ["aff_name", "aff_country", "total_citations"]
-            org_metrics = org_metrics.merge(org_cit, on=grp_cols, how="left").fillna(0)
+            first_pub_row = ~df_affiliations.duplicated(grp_cols + ["pub_id"])
+            org_frame = org_frame.assign(times_cited=df_affiliations["times_cited"].where(first_pub_row, 0))
+            agg["total_citations"] = ("times_cited", "sum")
+        org_metrics = org_frame.groupby(grp_cols, observed=True, sort=False).agg(**agg).reset_index()
+        if "total_citations" in org_metrics.columns:
             org_metrics["avg_citations"] = (
                 org_metrics["total_citations"] / org_metrics["researcher_count"].replace(0, 1)
             ).round(1)
@@ -412,11 +418,11 @@ def build_research_organisations_context(
             df_affiliations[df_affiliations["researcher_id"].notna() & (df_affiliations["researcher_id"] != "")]
             ["researcher_id"].value_counts()
         )
-        # Build name lookup
+        # Build name (and first-seen organisation) lookup once instead of rescanning per researcher
         name_lookup = (
             df_affiliations.dropna(subset=["researcher_id"])
             .drop_duplicates(subset=["researcher_id"])
-            .set_index("researcher_id")[["first_name", "last_name"]]
+            .set_index("researcher_id")[["first_name", "last_name"] + (["aff_name"] if has_name else [])]
         )
         lines.append("\nTOP RESEARCHERS BY PUBLICATION COUNT:")
         for rid, pub_count in researcher_pubs.head(20).items():
@@ -425,8 +431,8 @@ def build_research_organisations_context(
                 ln = name_lookup.at[rid, "last_name"] or ""
                 org = ""
                 if has_name:
-                    row = df_affiliations[df_affiliations["researcher_id"] == rid].iloc[0]
-                    org = f" ({row['aff_name']})" if pd.notna(row.get("aff_name")) else ""
+                    aff_name = name_lookup.at[rid, "aff_name"]
+                    org = f" ({aff_name})" if pd.notna(aff_name) else ""
                 lines.append(f"  {fn} {ln}{org}: {pub_count} publications")
 
         # Top researchers by citations
@@ -451,7 +457,7 @@ def build_research_organisations_context(
             ["aff_country"].value_counts()
         )
         lines.append("\nCOUNTRIES (affiliation appearances):")
-        for country, cnt in country_counts.head(15).items():
+        for country, cnt in country_counts[country_counts > 0].head(15).items():
             lines.append(f"  {country}: {cnt}")
 
     return "\n".join(lines)
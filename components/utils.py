@@ -1,6 +1,8 @@
 """
 Utility functions for components.
 """
+from functools import lru_cache
+
 import pandas as pd
 try:
     import pycountry
@@ -9,68 +11,106 @@ except ImportError:
     PYCOUNTRY_AVAILABLE = False
 
 
-def get_first_author_name(authors):
+# Country names as they commonly appear in Dimensions affiliation records that
+# do not match any pycountry name/common_name/official_name exactly.
+_COUNTRY_ALIASES = {
+    'USA': 'USA',
+    'UK': 'GBR',
+    'South Korea': 'KOR',
+    'North Korea': 'PRK',
+    'Russia': 'RUS',
+    'Vietnam': 'VNM',
+    'Turkey': 'TUR',
+    'Czech Republic': 'CZE',
+    'Macau': 'MAC',
+    'Laos': 'LAO',
+    'Syria': 'SYR',
+    'Moldova': 'MDA',
+    'Tanzania': 'TZA',
+    'Venezuela': 'VEN',
+    'Bolivia': 'BOL',
+    'Iran': 'IRN',
+    'Taiwan': 'TWN',
+    'Brunei': 'BRN',
+    'Ivory Coast': 'CIV',
+    'Palestine': 'PSE',
+}
+
+
+def _build_name_to_iso3() -> dict:
+    """Build a {lower-cased country name: ISO-3 code} lookup once from pycountry plus common aliases."""
+    if not PYCOUNTRY_AVAILABLE:
+        return {}
+    lookup = {}
+    for country in pycountry.countries:
+        for attr in ('name', 'common_name', 'official_name'):
+            name = getattr(country, attr, None)
+            if name:
+                lookup[name.lower()] = country.alpha_3
+    lookup.update((name.lower(), code) for name, code in _COUNTRY_ALIASES.items())
+    return lookup
+
+
+_NAME_TO_ISO3 = _build_name_to_iso3()
+
+
+@lru_cache(maxsize=4096)
+def get_country_code(country_name):
     """
-    Extract first author's first_name and last_name from authors column.
+    Convert country name to ISO-3 code.
+    
+    Resolved through the pre-built name dictionary; pycountry's fuzzy search is
+    only a last resort, and every result (including misses) is memoised.
     
     Args:
-        authors: Authors data (typically a list of dictionaries)
+        country_name: Name of the country
         
     Returns:
-        Tuple of (first_name, last_name) or (None, None) if not available
+        ISO-3 country code (str) or None if not found
     """
-    # Check for None or NaN (scalar values only)
-    if authors is None:
-        return None, None
+    if not PYCOUNTRY_AVAILABLE or not isinstance(country_name, str):
+        return None
     
-    # Check for NaN - only for scalar values to avoid array ambiguity
+    code = _NAME_TO_ISO3.get(country_name.strip().lower())
+    if code:
+        return code
     try:
-        if isinstance(authors, float) and pd.isna(authors):
-            return None, None
-    except (TypeError, ValueError):
-        pass
-    
-    # Check if it's a list and not empty
-    if not isinstance(authors, list):
-        return None, None
+        return pycountry.countries.search_fuzzy(country_name)[0].alpha_3
+    except (LookupError, IndexError):
+        return None
+
+
+def get_country_codes(country_names: pd.Series) -> pd.Series:
+    """
+    Convert a Series of country names to ISO-3 codes.
     
-    if len(authors) == 0:
-        return None, None
+    Each distinct name is resolved once by the memoised get_country_code.
     
-    try:
-        # Get first author from list
-        first_author = authors[0]
-        if isinstance(first_author, dict):
-            first_name = first_author.get('first_name', '')
-            last_name = first_author.get('last_name', '')
-            return first_name, last_name
-    except (TypeError, AttributeError, IndexError):
-        pass
-    return None, None
+    Args:
+        country_names: Series of country names
+        
+    Returns:
+        Series of ISO-3 codes aligned to the input, NaN/None where not found
+    """
+    return country_names.map(get_country_code)
 
 
-def get_country_code(country_name):
+def top_n_with_other(counts: pd.Series, n: int = 15, other_label: str = 'Other') -> pd.Series:
     """
-    Convert country name to ISO-3 code.
+    Keep the n largest counts and fold the remainder into a single slice.
     
     Args:
-        country_name: Name of the country
+        counts: Series of counts indexed by label
+        n: Number of labels to keep
+        other_label: Label for the folded remainder
         
     Returns:
-        ISO-3 country code (str) or None if not found
+        Series of at most n + 1 counts, largest first
     """
-    if not PYCOUNTRY_AVAILABLE:
-        return None
-    
-    try:
-        # Try exact match first
-        country = pycountry.countries.search_fuzzy(country_name)[0]
-        return country.alpha_3
-    except (LookupError, IndexError):
-        # Try common name variations
-        try:
-            country = pycountry.countries.get(name=country_name)
-            return country.alpha_3
-        except (LookupError, AttributeError):
-            return None
-
+    counts = counts.sort_values(ascending=False)
+    if len(counts) <= n:
+        return counts
+    return pd.concat([
+        counts.iloc[:n],
+        pd.Series([counts.iloc[n:].sum()], index=[other_label]),
+    ])
@@ -7,15 +7,19 @@ All API interaction is contained here; the rest of the application only reads
 from aurin_cache.db via AurinDatabase.
 """
 import datetime
+import functools
 import importlib
 import importlib.util
 import pathlib
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, List, Optional
 from zipfile import Path
 
 import dimcli
 import pandas as pd
+from dimcli.core.auth import APISession
 
 from data.database import AurinDatabase, TREND_FIXED
 from data.media_capture import MediaCapture
@@ -29,7 +33,7 @@ _AURIN_SEARCH_TERMS = (
 
 _PUBLICATIONS_QUERY = f"""
     search publications for {_AURIN_SEARCH_TERMS}
-    return publications[id+title+authors+pages+type+volume+issue+journal+times_cited+date+date_online+category_for+category_sdg+concepts]
+    return publications[id+title+authors+type+journal+times_cited+date+category_for+category_sdg+concepts]
 """
 
 _POLICY_QUERY = f"""
@@ -64,11 +68,24 @@ _TREND_FOR_CATEGORIES = [
 
 _TREND_CHUNK_SIZE = 12
 
+# Shape check only: catches typos/pasted whitespace before the login's network round-trip
+_API_KEY_RE = re.compile(r"^[A-Za-z0-9_-]{20,}$")
+
 
 class CaptureError(Exception):
     """Raised when data capture fails with a user-actionable message."""
 
 
+@functools.lru_cache(maxsize=4)
+def _get_dsl(api_key: str, endpoint: str) -> "dimcli.Dsl":
+    """Log in once per (key, endpoint) and reuse the authenticated client across refreshes."""
+    # A private session per client: dimcli.login() would set the process-wide connection,
+    # so a cached client could re-authenticate with another key's credentials on a 403
+    session = APISession(verbose=False)
+    session.login(key=api_key, endpoint=endpoint, verbose=False)
+    return dimcli.Dsl(auth_session=session)
+
+
 def build_query_with_dates(
     query: str,
     from_date: Optional[str] = None,
@@ -119,6 +136,19 @@ def build_query_with_dates(
     return final_query
 
 
+def _collect_frames(futures: list) -> list:
+    """Resolve sub-entity conversion futures in page order, skipping empty or failed pages."""
+    frames = []
+    for future in futures:
+        try:
+            sub_df = future.result()
+        except Exception:
+            continue
+        if sub_df is not None and not sub_df.empty:
+            frames.append(sub_df)
+    return frames
+
+
 def _query_all_paginated(
     dsl,
     query: str,
@@ -154,69 +184,70 @@ def _query_all_paginated(
 
     print(f"Starting iteration with limit={limit} skip=0 ...")
 
-    while skip < API_SKIP_CAP:
-        t0 = time.time()
-        q = query.rstrip() + f"\nlimit {limit} skip {skip}"
-        res = dsl.query(q)
-        elapsed = time.time() - t0
-
-        if res.errors:
-            raise CaptureError(
-                f"Dimensions API error (skip={skip}): "
-                + str(getattr(res, "errors_string", None) or res.errors)
-            )
-
-        try:
-            batch_df = res.as_dataframe()
-        except Exception:
-            break
-
-        try:
-            reported = int(res.stats.get("total_count", 0) or 0)
-            max_seen_total = max(max_seen_total, reported)
-        except (ValueError, TypeError):
-            pass
-
-        if batch_df is None or batch_df.empty:
-            if skip < max_seen_total and consecutive_empty < MAX_CONSECUTIVE_EMPTY:
-                consecutive_empty += 1
-                print(
-                    f"[Retry {consecutive_empty}/{MAX_CONSECUTIVE_EMPTY}] "
-                    f"empty at skip={skip}, max seen total={max_seen_total}"
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        while skip < API_SKIP_CAP:
+            t0 = time.time()
+            q = query.rstrip() + f"\nlimit {limit} skip {skip}"
+            res = dsl.query(q)
+            elapsed = time.time() - t0
+
+            if res.errors:
+                raise CaptureError(
+                    f"Dimensions API error (skip={skip}): "
+                    + str(getattr(res, "errors_string", None) or res.errors)
                 )
-                time.sleep(2)
-                continue
-            break
 
-        consecutive_empty = 0
-        batch_size = len(batch_df)
-        print(f"{skip}-{skip + batch_size} / {max_seen_total or '?'} ({elapsed:.2f}s)")
+            try:
+                batch_df = res.as_dataframe()
+            except Exception:
+                break
+
+            try:
+                reported = int(res.stats.get("total_count", 0) or 0)
+                max_seen_total = max(max_seen_total, reported)
+            except (ValueError, TypeError):
+                pass
+
+            if batch_df is None or batch_df.empty:
+                if skip < max_seen_total and consecutive_empty < MAX_CONSECUTIVE_EMPTY:
+                    consecutive_empty += 1
+                    print(
+                        f"[Retry {consecutive_empty}/{MAX_CONSECUTIVE_EMPTY}] "
+                        f"empty at skip={skip}, max seen total={max_seen_total}"
+                    )
+                    time.sleep(2)
+                    continue
+                break
 
-        if "id" in batch_df.columns:
-            new_rows = batch_df[~batch_df["id"].isin(seen_ids)]
-            seen_ids.update(batch_df["id"].tolist())
-        else:
-            new_rows = batch_df
-
-        if not new_rows.empty:
-            main_dfs.append(new_rows)
-
-        if fetch_sub_entities:
-            for method_name, target in [
-                ("as_dataframe_authors", author_dfs),
-                ("as_dataframe_authors_affiliations", affil_dfs),
-                ("as_dataframe_investigators", invest_dfs),
-            ]:
-                fn = getattr(res, method_name, None)
-                if fn is not None:
-                    try:
-                        sub_df = fn()
-                        if sub_df is not None and not sub_df.empty:
-                            target.append(sub_df)
-                    except Exception:
-                        pass
-
-        skip += batch_size
+            consecutive_empty = 0
+            batch_size = len(batch_df)
+            print(f"{skip}-{skip + batch_size} / {max_seen_total or '?'} ({elapsed:.2f}s)")
+
+            if "id" in batch_df.columns:
+                new_rows = batch_df[~batch_df["id"].isin(seen_ids)]
+                seen_ids.update(batch_df["id"].tolist())
+            else:
+                new_rows = batch_df
+
+            if not new_rows.empty:
+                main_dfs.append(new_rows)
+
+            if fetch_sub_entities:
+                # Convert in the background so the next page's request overlaps the JSON->pandas work
+                for method_name, target in [
+                    ("as_dataframe_authors", author_dfs),
+                    ("as_dataframe_authors_affiliations", affil_dfs),
+                    ("as_dataframe_investigators", invest_dfs),
+                ]:
+                    fn = getattr(res, method_name, None)
+                    if fn is not None:
+                        target.append(pool.submit(fn))
+
+            skip += batch_size
+
+        author_dfs, affil_dfs, invest_dfs = (
+            _collect_frames(futures) for futures in (author_dfs, affil_dfs, invest_dfs)
+        )
 
     final_main = pd.concat(main_dfs, ignore_index=True) if main_dfs else pd.DataFrame()
     final_ids = set(final_main["id"].tolist()) if "id" in final_main.columns else None
@@ -289,13 +320,14 @@ class DataCapture:
         Run all capture steps in sequence.
 
         progress_callback receives (fraction: float 0.0–1.0, label: str).
-        Raises CaptureError on authentication failure.
+        Raises CaptureError on a malformed key or authentication failure.
         Per-dataset failures are collected and raised together at the end so
         that a single failing dataset does not abort the remaining ones.
         """
+        if not _API_KEY_RE.match((self.api_key or "").strip()):
+            raise CaptureError("Malformed Dimensions API key: check it was copied in full.")
         try:
-            dimcli.login(key=self.api_key, endpoint=self.endpoint)
-            dsl = dimcli.Dsl()
+            dsl = _get_dsl(self.api_key.strip(), self.endpoint)
         except Exception as e:
             raise CaptureError(f"Authentication failed: {e}") from e
 
@@ -384,21 +416,15 @@ class DataCapture:
                 and 'id' in df_main.columns
                 and 'times_cited' in df_main.columns
             ):
-                citation_df = df_main[['id', 'times_cited']].copy()
-                df_affiliations = df_affiliations.merge(
-                    citation_df,
-                    left_on='pub_id',
-                    right_on='id',
-                    how='left',
-                    suffixes=('', '_from_main'),
+                # Only one column is enriched, so a keyed lookup beats a full-frame merge
+                # Series lookup stays in pandas' hashtable; a repeated id (paging overlap) keeps its last row
+                ids = df_main.drop_duplicates('id', keep='last')
+                citation_map = pd.Series(
+                    ids['times_cited'].to_numpy(), index=ids['id'].to_numpy()
+                )
+                df_affiliations['times_cited'] = (
+                    df_affiliations['pub_id'].map(citation_map).astype('Int32')
                 )
-                if 'times_cited_from_main' in df_affiliations.columns:
-                    df_affiliations['times_cited'] = df_affiliations['times_cited_from_main']
-                    df_affiliations = df_affiliations.drop(
-                        columns=['times_cited_from_main'], errors='ignore'
-                    )
-                if 'id' in df_affiliations.columns:
-                    df_affiliations = df_affiliations.drop(columns=['id'], errors='ignore')
 
         # Main table: upsert (non-duplicating by 'id')
         if db.upsert_dataframe(df_main, "publications"):
@@ -198,6 +198,8 @@ class AurinDatabase:
         self,
         table_name: str,
         columns: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        params: tuple = (),
     ) -> pd.DataFrame:
         """
         Read a data table into a DataFrame, deserialising JSON columns.
@@ -208,11 +210,18 @@ class AurinDatabase:
             columns: Optional list of column names to SELECT. When None (default),
                      all columns are returned (SELECT *). Passing a subset avoids
                      loading and deserialising heavy JSON columns that are not needed.
+            where: Optional SQL predicate (without the WHERE keyword) evaluated by
+                   SQLite, so only matching rows are loaded and deserialised.
+                   Use ? placeholders and pass the values via params.
+            params: Values bound to the placeholders in where.
         """
         col_expr = ", ".join(f'"{c}"' for c in columns) if columns else "*"
+        sql = f"SELECT {col_expr} FROM [{table_name}]"
+        if where:
+            sql += f" WHERE {where}"
         try:
             with self._connect() as conn:
-                df = pd.read_sql(f"SELECT {col_expr} FROM [{table_name}]", conn)
+                df = pd.read_sql(sql, conn, params=params)
         except Exception:
             return pd.DataFrame()
 
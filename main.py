@@ -10,47 +10,8 @@ from data.capture import DataCapture, CaptureError
 from data import AurinDatabase
 from components.sidebar import SidebarComponent
 from components.header import HeaderComponent
-from components.research_papers import (
-    KeyMetricsComponent,
-    TrendsComponent,
-    TopCitedArticlesComponent,
-    RecentPapersComponent,
-    ResearchCategoriesComponent,
-    SDGCategoriesComponent,
-    ConceptsComponent,
-)
-from components.research_organisations import AffiliatedOrganisationsComponent, AffiliatedCountriesComponent
-from components.policy_documents import PolicyDocumentsComponent
-from components.patents import PatentsComponent
-from components.aurin_fundings import GrantsComponent
-from components.research_trend import ResearchTrendMonitorComponent
-from components.grant_trend import GrantTrendMonitorComponent
-from components.media_monitor import MediaMonitorComponent
-from components.ai_summary import AISummaryComponent
-from components.ai_providers.openrouter_provider import OpenRouterProvider
-from components.funding_signal import FundingSignalMonitorComponent
-from components.tab_ai_tools import (
-    render_tab_ai_tools,
-    build_research_papers_context,
-    build_research_organisations_context,
-    build_policy_documents_context,
-    build_research_trend_context,
-    build_grant_trend_context,
-    _SUMMARY_PROMPT_RESEARCH_PAPERS,
-    _SUMMARY_PROMPT_RESEARCH_ORGANISATIONS,
-    _SUMMARY_PROMPT_POLICY_DOCUMENTS,
-    _SUMMARY_PROMPT_RESEARCH_TREND,
-    _SUMMARY_PROMPT_GRANT_TREND,
-)
-from components.pdf_export import (
-    generate_research_papers_pdf,
-    generate_research_organisations_pdf,
-    generate_policy_documents_pdf,
-    generate_patents_pdf,
-    generate_grants_pdf,
-    generate_research_trend_pdf,
-    generate_grant_trend_pdf,
-)
+# Tab components (and plotly/fpdf behind them) are imported inside the branch that
+# renders them, so a run only pays for the active tab.
 
 # Page configuration
 st.set_page_config(
@@ -60,6 +21,13 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+
+@st.cache_resource
+def _get_loader(loader_cls):
+    """Stateless loader singletons shared across reruns and sessions."""
+    return loader_cls()
+
+
 # Initialize components
 sidebar = SidebarComponent()
 header = HeaderComponent()
@@ -96,6 +64,7 @@ if st.session_state.get('refresh_requested'):
         )
         _progress.progress(1.0, text="Capture complete.")
         st.cache_data.clear()
+        st.cache_resource.clear()
         st.success("Data refreshed successfully.")
     except CaptureError as e:
         st.error(f"Refresh failed: {e}")
@@ -105,14 +74,14 @@ if st.session_state.get('refresh_requested'):
         _progress.empty()
 
 # ── Phase 2: Read from DB (always — no API key required to view cached data) ──
-data_loader = DimensionsDataLoader()
+data_loader = _get_loader(DimensionsDataLoader)
 df_aurin_main, df_authors, df_affiliations, df_funders, df_investigators = data_loader.load_data(
     from_date=from_date_str, to_date=to_date_str
 )
-df_policies = PolicyDocumentsDataLoader().load_data(from_date=from_date_str, to_date=to_date_str)
-df_web_policies = WebPolicyDocumentsDataLoader().load_data()
-df_patents = PatentsDataLoader().load_data(from_date=from_date_str, to_date=to_date_str)
-df_grants = GrantsDataLoader().load_data(from_date=from_date_str, to_date=to_date_str)
+df_policies = _get_loader(PolicyDocumentsDataLoader).load_data(from_date=from_date_str, to_date=to_date_str)
+df_web_policies = _get_loader(WebPolicyDocumentsDataLoader).load_data()
+df_patents = _get_loader(PatentsDataLoader).load_data(from_date=from_date_str, to_date=to_date_str)
+df_grants = _get_loader(GrantsDataLoader).load_data(from_date=from_date_str, to_date=to_date_str)
 def _export_btn(label: str, pdf_bytes: bytes, filename: str) -> None:
     """Render a PDF download button aligned to the right of the page."""
     _, col = st.columns([5, 1])
@@ -128,6 +97,8 @@ def _export_btn(label: str, pdf_bytes: bytes, filename: str) -> None:
 
 # Media Monitor tab: works independently of Dimensions data
 if active_tab == "media_monitor":
+    from components.media_monitor import MediaMonitorComponent
+
     MediaMonitorComponent(openrouter_api_key=openrouter_api_key).render()
     st.stop()
 
@@ -136,6 +107,9 @@ has_data = df_aurin_main is not None and not df_aurin_main.empty
 
 if has_data:
     if active_tab == "ai_summary":
+        from components.ai_summary import AISummaryComponent
+        from components.ai_providers.openrouter_provider import OpenRouterProvider
+
         # No structured data to export — AI summary is generated text
         AISummaryComponent(
             main_data=df_aurin_main,
@@ -149,6 +123,20 @@ if has_data:
         ).render()
 
     elif active_tab == "research_papers":
+        from components.research_papers import (
+            KeyMetricsComponent,
+            TrendsComponent,
+            TopCitedArticlesComponent,
+            RecentPapersComponent,
+            ResearchCategoriesComponent,
+            SDGCategoriesComponent,
+            ConceptsComponent,
+        )
+        from components.tab_ai_tools import (
+            render_tab_ai_tools, build_research_papers_context, _SUMMARY_PROMPT_RESEARCH_PAPERS,
+        )
+        from components.pdf_export import generate_research_papers_pdf
+
         _export_btn(
             "📄 Export PDF",
             generate_research_papers_pdf(df_aurin_main, df_affiliations, from_date_str, to_date_str),
@@ -162,7 +150,9 @@ if has_data:
             summary_button_label="Generate Summary",
             summary_spinner="Summarising research papers...",
         )
-        KeyMetricsComponent(main_data=df_aurin_main, affiliations_data=df_affiliations).render()
+        KeyMetricsComponent(
+            main_data=df_aurin_main, affiliations_data=df_affiliations, from_date=from_date_str, to_date=to_date_str
+        ).render()
         TrendsComponent(data=df_aurin_main).render()
         TopCitedArticlesComponent(data=df_aurin_main).render()
         RecentPapersComponent(data=df_aurin_main).render()
@@ -171,6 +161,12 @@ if has_data:
         ConceptsComponent(data=df_aurin_main).render()
 
     elif active_tab == "research_organisations":
+        from components.research_organisations import AffiliatedOrganisationsComponent, AffiliatedCountriesComponent
+        from components.tab_ai_tools import (
+            render_tab_ai_tools, build_research_organisations_context, _SUMMARY_PROMPT_RESEARCH_ORGANISATIONS,
+        )
+        from components.pdf_export import generate_research_organisations_pdf
+
         _export_btn(
             "📄 Export PDF",
             generate_research_organisations_pdf(df_affiliations, from_date_str, to_date_str),
@@ -184,10 +180,18 @@ if has_data:
             summary_button_label="Generate Summary",
             summary_spinner="Summarising research organisations...",
         )
-        AffiliatedOrganisationsComponent(main_data=df_aurin_main, affiliations_data=df_affiliations).render()
-        AffiliatedCountriesComponent(affiliations_data=df_affiliations).render()
+        AffiliatedOrganisationsComponent(
+            main_data=df_aurin_main, affiliations_data=df_affiliations, from_date=from_date_str, to_date=to_date_str
+        ).render()
+        AffiliatedCountriesComponent(affiliations_data=df_affiliations, from_date=from_date_str, to_date=to_date_str).render()
 
     elif active_tab == "policy_documents":
+        from components.policy_documents import PolicyDocumentsComponent
+        from components.tab_ai_tools import (
+            render_tab_ai_tools, build_policy_documents_context, _SUMMARY_PROMPT_POLICY_DOCUMENTS,
+        )
+        from components.pdf_export import generate_policy_documents_pdf
+
         _export_btn(
             "📄 Export PDF",
             generate_policy_documents_pdf(df_policies, df_web_policies, from_date_str, to_date_str),
@@ -204,6 +208,9 @@ if has_data:
         PolicyDocumentsComponent(data=df_policies, web_data=df_web_policies).render()
 
     elif active_tab == "patents":
+        from components.patents import PatentsComponent
+        from components.pdf_export import generate_patents_pdf
+
         _export_btn(
             "📄 Export PDF",
             generate_patents_pdf(df_patents, from_date_str, to_date_str),
@@ -212,6 +219,9 @@ if has_data:
         PatentsComponent(data=df_patents).render()
 
     elif active_tab == "aurin_fundings":
+        from components.aurin_fundings import GrantsComponent
+        from components.pdf_export import generate_grants_pdf
+
         _export_btn(
             "📄 Export PDF",
             generate_grants_pdf(df_grants, from_date_str, to_date_str),
@@ -220,7 +230,13 @@ if has_data:
         GrantsComponent(data=df_grants).render()
 
     elif active_tab == "research_trend_monitor":
-        df_trend_monitor = ResearchTrendMonitorDataLoader().load_data()
+        from components.research_trend import ResearchTrendMonitorComponent
+        from components.tab_ai_tools import (
+            render_tab_ai_tools, build_research_trend_context, _SUMMARY_PROMPT_RESEARCH_TREND,
+        )
+        from components.pdf_export import generate_research_trend_pdf
+
+        df_trend_monitor = _get_loader(ResearchTrendMonitorDataLoader).load_data()
         _export_btn(
             "📄 Export PDF",
             generate_research_trend_pdf(df_trend_monitor),
@@ -237,7 +253,13 @@ if has_data:
         ResearchTrendMonitorComponent(publications_data=df_trend_monitor).render()
 
     elif active_tab == "grant_trend_monitor":
-        df_grant_trend_monitor = GrantTrendMonitorDataLoader().load_data()
+        from components.grant_trend import GrantTrendMonitorComponent
+        from components.tab_ai_tools import (
+            render_tab_ai_tools, build_grant_trend_context, _SUMMARY_PROMPT_GRANT_TREND,
+        )
+        from components.pdf_export import generate_grant_trend_pdf
+
+        df_grant_trend_monitor = _get_loader(GrantTrendMonitorDataLoader).load_data()
         _export_btn(
             "📄 Export PDF",
             generate_grant_trend_pdf(df_grant_trend_monitor),
@@ -254,7 +276,9 @@ if has_data:
         GrantTrendMonitorComponent(grants_data=df_grant_trend_monitor).render()
 
     elif active_tab == "funding_signal_monitor":
-        df_fsm_trend  = FundingSignalDataLoader().load_data()
+        from components.funding_signal import FundingSignalMonitorComponent
+
+        df_fsm_trend  = _get_loader(FundingSignalDataLoader).load_data()
         FundingSignalMonitorComponent(
             grant_trend_data=df_fsm_trend,
             publications_data=df_aurin_main,
@@ -0,0 +1,34 @@
+"""
+Tests for the cached helpers in components.research_organisations.affiliated_organisations.
+"""
+import pandas as pd
+
+from components.research_organisations.affiliated_organisations import _org_metrics
+
+
+def _affiliations(n: int = 6) -> pd.DataFrame:
+    return pd.DataFrame({
+        'aff_name': pd.Categorical(['Org A', 'Org A', 'Org B', 'Org A', 'Org B', 'Org C'][:n]),
+        'aff_country': pd.Categorical(['Australia'] * n),
+        'researcher_id': ['r1', 'r2', 'r1', 'r1', 'r3', 'r4'][:n],
+        'pub_id': ['p1', 'p1', 'p1', 'p2', 'p2', 'p3'][:n],
+        'times_cited': pd.Series([5, 5, 5, 2, 2, 1][:n], dtype='uint8'),
+    })
+
+
+def test_org_metrics_counts_each_publication_once():
+    _org_metrics.clear()
+    metrics = _org_metrics('2020-01-01', '2020-12-31', _affiliations()).set_index('aff_name')
+    assert metrics.loc['Org A', 'researcher_count'] == 2
+    assert metrics.loc['Org A', 'times_cited'] == 7
+    assert metrics.loc['Org B', 'times_cited'] == 7
+
+
+def test_org_metrics_is_keyed_on_the_date_range():
+    _org_metrics.clear()
+    full = _org_metrics('2020-01-01', '2020-12-31', _affiliations())
+    # Same key: the cached result is returned without looking at the (unhashed) frame
+    assert _org_metrics('2020-01-01', '2020-12-31', _affiliations(3)).equals(full)
+    # New key: recomputed from the frame passed in
+    assert len(_org_metrics('2021-01-01', '2021-12-31', _affiliations(3))) == 2
+    _org_metrics.clear()
@@ -0,0 +1,31 @@
+"""
+Tests for data.capture.
+"""
+from unittest import mock
+
+import dimcli
+from dimcli.core.auth import APISession
+
+from data.capture import _get_dsl
+
+
+def _fake_login(self, key='', endpoint='', **kwargs):
+    self.key = key
+    self.url = endpoint
+    self.token = f"token-for-{key}"
+    self.verify_ssl = True
+
+
+def test_get_dsl_binds_client_to_its_own_session():
+    _get_dsl.cache_clear()
+    with mock.patch.object(APISession, 'login', autospec=True, side_effect=_fake_login) as login:
+        dsl_a = _get_dsl("a" * 32, "https://app.dimensions.ai")
+        dsl_b = _get_dsl("b" * 32, "https://app.dimensions.ai")
+    _get_dsl.cache_clear()
+
+    assert login.call_count == 2
+    assert isinstance(dsl_a, dimcli.Dsl)
+    assert isinstance(dsl_a._CONNECTION, APISession)
+    assert dsl_a._CONNECTION is not dsl_b._CONNECTION
+    assert dsl_a._headers == {'Authorization': "JWT token-for-" + "a" * 32}
+    assert dsl_b._headers == {'Authorization': "JWT token-for-" + "b" * 32}